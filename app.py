@@ -1,7 +1,21 @@
-import json
 import os
+import bcrypt
 import boto3
-from flask import Flask, render_template, request, redirect, url_for, session, jsonify
+import orjson
+from boto3.s3.transfer import TransferConfig
+import botocore.session
+from flask import (
+    Flask,
+    render_template,
+    request,
+    redirect,
+    url_for,
+    session,
+    jsonify,
+    make_response,
+    g,
+)
+from flask.json.provider import DefaultJSONProvider
 from flask_login import (
     LoginManager,
     UserMixin,
@@ -10,21 +24,68 @@ from flask_login import (
     logout_user,
     current_user,
 )
+from flask_caching import Cache
+from flask_compress import Compress
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import case
+from sqlalchemy import case, delete, func, insert, or_, select, tuple_, update
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import joinedload
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import raiseload, selectinload
 from pathlib import Path
 from dotenv import load_dotenv
-from datetime import datetime
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import functools
+import logging
+import hashlib
+import hmac
+from itertools import groupby
 import re, time
 
+try:
+    from s3transfer.crt import (
+        BotocoreCRTCredentialsWrapper,
+        BotocoreCRTRequestSerializer,
+        CRTTransferManager,
+        create_s3_crt_client,
+    )
+except ImportError:  # 未安裝 awscrt 時退回 boto3 的上傳方式
+    CRTTransferManager = None
+
 # 載入本地 .env 環境變數# 確保永遠讀到正確的 .env
 env_path = Path(__file__).parent / ".env"
 load_dotenv(dotenv_path=env_path)
 
+
+class ORJSONProvider(DefaultJSONProvider):
+    # 以 orjson 進行 JSON 序列化/解析；日期交回 Flask 預設處理，輸出格式不變
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # jsonify 直接使用 orjson 產生的 bytes，省去 decode 再 encode
+        obj = self._prepare_response_obj(args, kwargs)
+        option = self.option
+        if self.compact is False or (self.compact is None and self._app.debug):
+            option |= orjson.OPT_INDENT_2
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=option),
+            mimetype=self.mimetype,
+        )
+
+
 app = Flask(__name__)
 
+# 正式環境預設 INFO，計時與除錯訊息用 debug 輸出，不會格式化字串
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+logger = logging.getLogger(__name__)
+app.json = ORJSONProvider(app)
+
 # Flask-Login 配置
 app.secret_key = "your_secret_key"  # 用于加密会话
 login_manager = LoginManager()
@@ -36,6 +97,8 @@ S3_BUCKET = "ntusc-files"
 S3_REGION = "ap-southeast-1"  # 修改為你的 AWS 區域
 S3_KEY = os.getenv("AWS_ACCESS_KEY_ID")
 S3_SECRET = os.getenv("AWS_SECRET_ACCESS_KEY")
+# 公開檔案網址的共同前綴
+S3_URL_PREFIX = f"https://{S3_BUCKET}.s3.{S3_REGION}.amazonaws.com/"
 
 s3 = boto3.client(
     "s3",
@@ -43,12 +106,181 @@ s3 = boto3.client(
     aws_secret_access_key=S3_SECRET,
     region_name=S3_REGION,
 )
+
+
+def create_crt_manager():
+    # 以 AWS CRT（C 實作的 multipart 與非同步 I/O）建立 S3 上傳管理器
+    botocore_session = botocore.session.get_session()
+    if S3_KEY and S3_SECRET:
+        botocore_session.set_credentials(S3_KEY, S3_SECRET)
+    credentials = BotocoreCRTCredentialsWrapper(botocore_session.get_credentials())
+    target_gbps = os.getenv("S3_CRT_TARGET_GBPS")  # 未設定則由 CRT 自動偵測
+    crt_client = create_s3_crt_client(
+        S3_REGION,
+        crt_credentials_provider=credentials.to_crt_credentials_provider(),
+        target_throughput=(
+            int(float(target_gbps) * 1_000_000_000 / 8) if target_gbps else None
+        ),
+    )
+    serializer = BotocoreCRTRequestSerializer(
+        botocore_session, {"region_name": S3_REGION}
+    )
+    return CRTTransferManager(crt_client, serializer)
+
+
+# 設定 S3_USE_CRT=1 時上傳改走 CRT；刪除等輕量操作仍使用上面的 boto3 client
+# gevent worker 下 CRT 在自己的原生執行緒完成上傳，無法可靠喚醒等待 .result() 的 greenlet，
+# 因此一律改用 boto3（其 I/O 已被 gevent 打補丁）
+USE_S3_CRT = (
+    os.getenv("S3_USE_CRT") == "1"
+    and CRTTransferManager is not None
+    and not os.getenv("USE_GEVENT")
+)
+crt_manager = create_crt_manager() if USE_S3_CRT else None
+# 預設以 boto3 上傳，依檔案大小選擇上傳設定
+MULTIPART_THRESHOLD = 16 * 1024 * 1024
+# 小檔直接單次上傳，不另開執行緒
+SMALL_CFG = TransferConfig(use_threads=False, multipart_threshold=MULTIPART_THRESHOLD)
+# 影音等大檔採 multipart 分段並行上傳
+BIG_CFG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD,
+    multipart_chunksize=MULTIPART_THRESHOLD,
+    max_concurrency=10,
+    use_threads=True,
+)
+# 共用的上傳執行緒池，避免每次請求重建執行緒
+upload_executor = ThreadPoolExecutor(max_workers=10)
+# 以 gevent worker 執行時，讓 psycopg2 等待 I/O 時交還給其他 greenlet
+if os.getenv("USE_GEVENT"):
+    try:
+        from psycogreen.gevent import patch_psycopg
+
+        patch_psycopg()
+    except ImportError:
+        pass
+
 # 設定 SQLAlchemy 資料庫連線
 app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv("DATABASE_URL")
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+# 連線池：加大容量、使用前先 ping、定期回收閒置連線
+# gevent worker 同時處理的請求多，可用 DB_POOL_SIZE / DB_MAX_OVERFLOW 調大
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", 20)),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 20)),
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+}
+if (
+    app.config["SQLALCHEMY_DATABASE_URI"]
+    and make_url(app.config["SQLALCHEMY_DATABASE_URI"]).get_driver_name() == "psycopg2"
+):
+    # 批次 INSERT 已由 insertmanyvalues 合併成多列 VALUES；
+    # 批次 UPDATE/DELETE（如刪議程時的關聯表）也改用 execute_batch 分頁送出
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"]["executemany_mode"] = "values_plus_batch"
 app.config["SECRET_KEY"] = os.getenv("SECRET_KEY", "default-secret")
 
-db = SQLAlchemy(app)
+# commit 後不必重新載入物件，且只在明確 flush/commit 時寫入
+db = SQLAlchemy(app, session_options={"expire_on_commit": False, "autoflush": False})
+
+# 公開檢視端點的回應快取，由所有 worker 共用 Redis；
+# 沒有 REDIS_URL 時不快取，否則各 worker 各自一份，異動後其他 worker 清不到
+cache = Cache(
+    app,
+    config={
+        "CACHE_TYPE": "RedisCache" if os.getenv("REDIS_URL") else "NullCache",
+        "CACHE_REDIS_URL": os.getenv("REDIS_URL"),
+        "CACHE_DEFAULT_TIMEOUT": 300,
+    },
+)
+
+# JSON 回應壓縮；欄位名稱重複、中文內容多，壓縮率很高
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_MIN_SIZE"] = 1024
+app.config["COMPRESS_MIMETYPES"] = ["application/json"]
+Compress(app)
+
+
+def is_ok_response(rv):
+    # 只快取成功的回應
+    return isinstance(rv, tuple) and rv[1] == 200
+
+
+def utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def viewer_version(Model, item_id=None):
+    # 列表：公開資料的 筆數 + 最後更新時間（刪除或隱藏會改變筆數）；
+    # 單筆：該列的最後更新時間。找不到資料時回傳 None
+    if item_id is None:
+        return tuple(
+            db.session.execute(
+                select(func.count(), func.max(Model.updated_at)).where(
+                    Model.is_visible == True
+                )
+            ).one()
+        )
+    updated_at = db.session.execute(
+        select(Model.updated_at).where(Model.id == item_id)
+    ).first()
+    return None if updated_at is None else tuple(updated_at)
+
+
+def viewer_cache_key():
+    # 快取鍵包含資料版本：異動後自然換成新鍵，不必逐一清除，
+    # 也不會把其他 worker 寫回的舊內容配上新版本的 ETag
+    return f"viewer:{g.viewer_etag}"
+
+
+def set_validators(response, etag, last_modified=None):
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    # 瀏覽器每次都帶 ETag 回來確認；內容依 Accept-Encoding 壓縮
+    response.cache_control.no_cache = True
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def conditional_get(Model):
+    # 先用一個小查詢取得資料版本，沒變就直接回 304，不必查詢內容與序列化
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            item_id = kwargs.get("id")
+            version = viewer_version(Model, item_id)
+            if version is None:  # 找不到資料，交給 view 回 404
+                return view(*args, **kwargs)
+            etag = hashlib.md5(f"{request.full_path}:{version}".encode()).hexdigest()
+            g.viewer_version = version
+            g.viewer_etag = etag
+            # 列表的最大更新時間不會因刪除而改變，只有單筆內容附上 Last-Modified
+            last_modified = version[-1] if item_id is not None else None
+
+            # Flask-Compress 送出的 ETag 帶有 ":br" 之類的編碼後綴，比對時沿用客戶端的值
+            client_etag = next(
+                (
+                    tag
+                    for tag in request.if_none_match.as_set()
+                    if tag.split(":", 1)[0] == etag
+                ),
+                etag,
+            )
+            response = set_validators(
+                app.response_class(), client_etag, last_modified
+            ).make_conditional(request)
+            if response.status_code == 304:
+                return response
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                set_validators(response, etag, last_modified)
+            return response
+
+        return wrapper
+
+    return decorator
+
 
 # 假设文章存储在字典中
 articles = {}
@@ -73,6 +305,16 @@ class User(UserMixin, db.Model):
 
 # 通知資料表
 class Notification(db.Model):
+    __table_args__ = (
+        db.Index("ix_notif_session_date", "session", "datestart"),
+        # 檢視端點只列出公開資料
+        db.Index("ix_notif_visible_session", "is_visible", "session", "datestart"),
+        # 檢視列表依日期分頁
+        db.Index("ix_notif_visible_date", "is_visible", "datestart", "id"),
+        # 檢視端點的版本查詢（筆數 + 最後更新時間）
+        db.Index("ix_notif_visible_updated", "is_visible", "updated_at"),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(100), nullable=False)
     session = db.Column(db.Integer, nullable=False)
@@ -89,6 +331,8 @@ class Notification(db.Model):
     attendance = db.Column(JSONB, nullable=True)  # 不允許為NULL
     present = db.Column(JSONB, nullable=True)  # 不允許為NULL
     is_visible = db.Column(db.Boolean, default=True, nullable=False)
+    # 最後修改時間（UTC），供檢視端點的 ETag / Last-Modified 使用
+    updated_at = db.Column(db.DateTime, default=utcnow, onupdate=utcnow)
 
     # 外鍵連接到用戶
     user_id = db.Column(
@@ -105,6 +349,16 @@ class Notification(db.Model):
 
 # 紀錄資料表
 class Record(db.Model):
+    __table_args__ = (
+        db.Index("ix_record_session_date", "session", "datestart"),
+        # 檢視端點只列出公開資料
+        db.Index("ix_record_visible_session", "is_visible", "session", "datestart"),
+        # 檢視列表依日期分頁
+        db.Index("ix_record_visible_date", "is_visible", "datestart", "id"),
+        # 檢視端點的版本查詢（筆數 + 最後更新時間）
+        db.Index("ix_record_visible_updated", "is_visible", "updated_at"),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(100), nullable=False)
     session = db.Column(db.Integer, nullable=False)
@@ -121,6 +375,8 @@ class Record(db.Model):
     attendance = db.Column(JSONB, nullable=True)  # 不允許為NULL
     present = db.Column(JSONB, nullable=True)
     is_visible = db.Column(db.Boolean, default=True, nullable=False)
+    # 最後修改時間（UTC），供檢視端點的 ETag / Last-Modified 使用
+    updated_at = db.Column(db.DateTime, default=utcnow, onupdate=utcnow)
 
     # 外鍵連接到用戶
     user_id = db.Column(
@@ -137,6 +393,11 @@ class Record(db.Model):
 
 # Schedule 表格
 class Schedule(db.Model):
+    __table_args__ = (
+        db.Index("ix_sched_notif", "notification_id"),
+        db.Index("ix_sched_rec", "record_id"),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(100), nullable=False)
     notification_id = db.Column(
@@ -185,6 +446,11 @@ class Detail(db.Model):
 
 
 class File(db.Model):
+    __table_args__ = (
+        db.Index("ix_file_safe", "filename_with_timestamp", unique=True),
+        db.Index("ix_file_orig", "original_filename"),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     original_filename = db.Column(db.String(255), nullable=False)
     filename_with_timestamp = db.Column(db.String(255), nullable=False)
@@ -195,11 +461,20 @@ class File(db.Model):
 
 # 規章主表
 class Regulation(db.Model):
+    __table_args__ = (
+        db.Index("ix_reg_visible_id", "is_visible", "id"),
+        db.Index("ix_reg_visible_category", "is_visible", "category"),
+        # 檢視端點的版本查詢（筆數 + 最後更新時間）
+        db.Index("ix_reg_visible_updated", "is_visible", "updated_at"),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(255), nullable=False)
     category = db.Column(db.String(255))
     description = db.Column(db.Text)
     is_visible = db.Column(db.Boolean, default=True)
+    # 最後修改時間（UTC），供檢視端點的 ETag / Last-Modified 使用
+    updated_at = db.Column(db.DateTime, default=utcnow, onupdate=utcnow)
 
     # 關聯章節與修訂紀錄
     chapters = db.relationship(
@@ -221,7 +496,7 @@ class Regulation(db.Model):
 class Revision(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     regulation_id = db.Column(
-        db.Integer, db.ForeignKey("regulation.id"), nullable=False
+        db.Integer, db.ForeignKey("regulation.id", ondelete="CASCADE"), nullable=False
     )
     modified_at = db.Column(db.Date, nullable=False)
     note = db.Column(db.Text)
@@ -234,13 +509,17 @@ class Revision(db.Model):
 class Chapter(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     regulation_id = db.Column(
-        db.Integer, db.ForeignKey("regulation.id"), nullable=False
+        db.Integer, db.ForeignKey("regulation.id", ondelete="CASCADE"), nullable=False
     )
     number = db.Column(db.Integer)  # 第幾章
     title = db.Column(db.String(255))
 
     articles = db.relationship(
-        "Article", backref="chapter", lazy=True, cascade="all, delete-orphan"
+        "Article",
+        backref="chapter",
+        lazy=True,
+        order_by="Article.sort_index",
+        cascade="all, delete-orphan",
     )
 
     def __repr__(self):
@@ -248,8 +527,12 @@ class Chapter(db.Model):
 
 
 class Article(db.Model):
+    __table_args__ = (db.Index("ix_article_chapter_sort", "chapter_id", "sort_index"),)
+
     id = db.Column(db.Integer, primary_key=True)
-    chapter_id = db.Column(db.Integer, db.ForeignKey("chapter.id"), nullable=False)
+    chapter_id = db.Column(
+        db.Integer, db.ForeignKey("chapter.id", ondelete="CASCADE"), nullable=False
+    )
 
     title = db.Column(db.String(255), nullable=False)  # 條標題，如「第四條之一」
     sort_index = db.Column(
@@ -267,12 +550,18 @@ class Article(db.Model):
 # 項
 class Paragraph(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    article_id = db.Column(db.Integer, db.ForeignKey("article.id"), nullable=False)
+    article_id = db.Column(
+        db.Integer, db.ForeignKey("article.id", ondelete="CASCADE"), nullable=False
+    )
     number = db.Column(db.Integer)  # 第幾項
     content = db.Column(db.Text)
 
     clauses = db.relationship(
-        "Clause", backref="paragraph", lazy=True, cascade="all, delete-orphan"
+        "Clause",
+        backref="paragraph",
+        lazy=True,
+        order_by="Clause.number",
+        cascade="all, delete-orphan",
     )
 
     def __repr__(self):
@@ -282,7 +571,9 @@ class Paragraph(db.Model):
 # 款
 class Clause(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    paragraph_id = db.Column(db.Integer, db.ForeignKey("paragraph.id"), nullable=False)
+    paragraph_id = db.Column(
+        db.Integer, db.ForeignKey("paragraph.id", ondelete="CASCADE"), nullable=False
+    )
     number = db.Column(db.Integer)  # 第幾款
     content = db.Column(db.Text)
 
@@ -300,15 +591,32 @@ def drop_table(YourModel):
     with app.app_context():
         try:
             YourModel.__table__.drop(db.engine)
-            print("資料表已成功刪除。")
-        except Exception as e:
-            print("刪除失敗：", e)
+            logger.info("資料表已成功刪除。")
+        except Exception:
+            logger.exception("刪除失敗")
 
 
 # drop_table(File)
 # drop_table(Detail)
 
 
+def hash_password(password):
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+
+
+def check_password(user, password):
+    # 密碼以 bcrypt 雜湊儲存；舊的明文密碼在第一次登入成功時升級為雜湊
+    if not password:
+        return False
+    if user.password.startswith("$2"):
+        return bcrypt.checkpw(password.encode(), user.password.encode())
+    if hmac.compare_digest(user.password.encode(), password.encode()):
+        user.password = hash_password(password)
+        db.session.commit()
+        return True
+    return False
+
+
 # 創建測試資料的函數
 def create_test_user():
     with app.app_context():
@@ -317,12 +625,12 @@ def create_test_user():
         password = "123"  # 密碼可以是任意的
 
         # 檢查使用者是否已經存在
-        existing_user = User.query.filter_by(username=username).first()
+        existing_user = db.session.scalar(select(User).filter_by(username=username))
         if existing_user:
-            print(f"User '{username}' already exists.")
+            logger.info("User '%s' already exists.", username)
             return
         # 密碼加密
-        hashed_password = password
+        hashed_password = hash_password(password)
 
         # 創建新的使用者
         new_user = User(username=username, password=hashed_password)
@@ -330,7 +638,7 @@ def create_test_user():
         # 將新的使用者物件加入資料庫
         db.session.add(new_user)
         db.session.commit()
-        print(f"User '{username}' created successfully.")
+        logger.info("User '%s' created successfully.", username)
 
 
 # 呼叫創建測試用戶的函數
@@ -369,12 +677,17 @@ chinese_numbers = {
     "二十九": 29,
     "三十": 30,
 }
+# 反查表：數字 -> 中文數字
+_NUM_TO_CHINESE = {v: k for k, v in chinese_numbers.items()}
+# "第xx屆" 格式的正則表達式，只編譯一次
+_SESSION_RE = re.compile(r"第([一二三四五六七八九十]+)屆")
 
 
 # 函數：將 "第xx屆" 轉換為數字
+@functools.lru_cache(maxsize=128)
 def chinese_to_number(chinese_str):
     # 使用正則表達式匹配 "第xx屆" 格式的字串
-    match = re.match(r"第([一二三四五六七八九十]+)屆", chinese_str)
+    match = _SESSION_RE.match(chinese_str)
     if match:
         chinese_number = match.group(1)  # 提取數字部分
         return chinese_numbers.get(
@@ -386,31 +699,44 @@ def chinese_to_number(chinese_str):
 # 函数：将数字转换为 "第xx屆" 形式的中文
 def number_to_chinese(num):
     # 先检查数字是否在字典中
-    for chinese_str, number in chinese_numbers.items():
-        if num == number:
-            return f"第{chinese_str}屆"
+    chinese_str = _NUM_TO_CHINESE.get(num)
+    if chinese_str:
+        return f"第{chinese_str}屆"
     return f"第{num}屆"  # 如果没有找到，则返回默认格式
 
 
+# 保留中文、英文、數字、底線、括號、點、減號
+_SAFE_RE = re.compile(r"[^\w\u4e00-\u9fa5().-]")
+# 純 ASCII 檔名的轉換表：不合法字元一律換成底線
+_ASCII_TABLE = {
+    i: "_" for i in range(128) if not (chr(i).isalnum() or chr(i) in "_().-")
+}
+
+
 def custom_secure_filename(filename):
-    # 保留中文、英文、數字、底線、括號、點、減號
-    filename = re.sub(r"[^\w\u4e00-\u9fa5().-]", "_", filename)
-    return filename
+    # 純 ASCII 走 str.translate，不必進正則引擎
+    if filename.isascii():
+        return filename.translate(_ASCII_TABLE)
+    return _SAFE_RE.sub("_", filename)
 
 
 def generate_unique_filename(original_filename):
-    base, ext = original_filename.rsplit(".", 1)
-    base = custom_secure_filename(base)
-    ext = custom_secure_filename(ext)
-    safe_name = f"{base}.{ext}"
+    # 點會被保留，整串清理一次再拆副檔名即可
+    safe_name = custom_secure_filename(original_filename)
+    base, ext = safe_name.rsplit(".", 1)
 
     # 檢查資料庫中是否存在
-    existing = File.query.filter_by(original_filename=safe_name).first()
+    existing = db.session.scalar(
+        select(File.id).filter_by(original_filename=safe_name).limit(1)
+    )
     if existing:
         timestamp = int(time.time())
         safe_name = f"{base}_{timestamp}.{ext}"
 
-    return safe_name
+    # 加上短雜湊前綴，讓 S3 key 分散到不同分區
+    # 前端以網址最後一段當作檔名 key，因此前綴不能用 "/"
+    prefix = hashlib.blake2b(safe_name.encode(), digest_size=2).hexdigest()
+    return f"{prefix}-{safe_name}"
 
 
 def convert_to_dict(data):
@@ -422,55 +748,161 @@ def convert_to_dict(data):
     return result
 
 
-def getAllMeetTitleFromDB(Table, only_visible: bool = False):
-    query = db.session.query(Table)
+def clear_list_cache():
+    # 任何通知/紀錄/規章寫入後清空列表快取；快取在所有 worker 共用，一次清除即可
+    cache.delete_memoized(getAllMeetTitleFromDB)
+    cache.delete_memoized(getAllRegulationTitleFromDB)
+
+
+def _query_meet_titles(Table, only_visible: bool = False):
+    # 只取列表需要的欄位，不載入出缺席等大型 JSONB 欄位
+    query = select(Table.id, Table.title, Table.session, Table.is_visible)
 
     if only_visible:
-        query = query.filter(Table.is_visible == True)
+        query = query.where(Table.is_visible == True)
 
-    tables = query.order_by(Table.session.desc(), Table.datestart.desc()).all()
+    rows = db.session.execute(
+        query.order_by(Table.session.desc(), Table.datestart.desc())
+    ).all()
     result = []
     seen_sessions = set()
     session_list = []
 
-    for table in tables:
-        session_str = table.session
-        if session_str not in seen_sessions:
-            seen_sessions.add(session_str)
-            session_list.append(session_str)
-
-        result.append(
-            {
-                "id": table.id,
-                "title": table.title,
-                "session": session_str,
-                "is_visible": table.is_visible,
-            }
-        )
+    for row in rows:
+        if row.session not in seen_sessions:
+            seen_sessions.add(row.session)
+            session_list.append(row.session)
+        result.append(row._asdict())
 
     return result, session_list
 
 
-def serialize_schedule(schedule):
-    return {
-        "id": schedule.id,
-        "title": schedule.title,
-        "details": [serialize_detail(detail) for detail in schedule.details],
-    }
+# 未登入者的列表短期快取；管理者直接呼叫 _query_meet_titles，寫入後重新整理一定看到最新資料
+@cache.memoize(timeout=30)
+def getAllMeetTitleFromDB(Table, only_visible: bool = False):
+    return _query_meet_titles(Table, only_visible)
 
 
-def serialize_detail(detail):
-    file_url_base = f"https://{S3_BUCKET}.s3.{S3_REGION}.amazonaws.com/"
-    return {
-        "id": detail.id,
-        "content": detail.content,
-        "file_name": [f.original_filename for f in detail.files],
-        "file_urls": [file_url_base + f.filename_with_timestamp for f in detail.files],
-    }
+# 檢視列表每頁筆數
+VIEWER_PAGE_SIZE = 50
+VIEWER_PAGE_MAX = 200
+
+
+def parse_page_args(args):
+    # ?before=<datestart>&before_id=<id>&limit=<n>，格式錯誤時丟出 ValueError
+    before = args.get("before")
+    before_id = args.get("before_id", type=int)
+    limit = int(args.get("limit", VIEWER_PAGE_SIZE))
+    if limit <= 0:
+        raise ValueError("limit 必須大於 0")
+    return (
+        datetime.fromisoformat(before) if before else None,
+        before_id,
+        min(limit, VIEWER_PAGE_MAX),
+    )
+
+
+def getMeetTitlePageFromDB(
+    Table, version, before=None, before_id=None, limit=VIEWER_PAGE_SIZE
+):
+    # keyset 分頁：依 (datestart, id) 由新到舊，只掃描這一頁需要的列
+    query = select(
+        Table.id, Table.title, Table.session, Table.is_visible, Table.datestart
+    ).where(Table.is_visible == True)
+    if before is not None:
+        if before_id is None:
+            query = query.where(Table.datestart < before)
+        else:
+            query = query.where(tuple_(Table.datestart, Table.id) < (before, before_id))
+    rows = db.session.execute(
+        query.order_by(Table.datestart.desc(), Table.id.desc()).limit(limit)
+    ).all()
+
+    result = [
+        {
+            "id": row.id,
+            "title": row.title,
+            "session": row.session,
+            "is_visible": row.is_visible,
+        }
+        for row in rows
+    ]
+    next_cursor = None
+    if len(rows) == limit:
+        next_cursor = {
+            "before": rows[-1].datestart.isoformat(),
+            "before_id": rows[-1].id,
+        }
+    return result, getVisibleSessionsFromDB(Table, version), next_cursor
+
+
+# 屆次清單與分頁無關，每頁共用一份；version 是 conditional_get 取得的列表版本，
+# 資料異動後換成新鍵，不必另外清除
+@cache.memoize(timeout=300)
+def getVisibleSessionsFromDB(Table, version):
+    return db.session.scalars(
+        select(Table.session)
+        .where(Table.is_visible == True)
+        .distinct()
+        .order_by(Table.session.desc())
+    ).all()
+
+
+def getSchedulesFromDB(id, is_record):
+    # 單一扁平查詢取回 議程/細項/檔案，再依 schedule、detail 分組組成 JSON
+    schedule_filter = (
+        Schedule.record_id == id if is_record else Schedule.notification_id == id
+    )
+    rows = db.session.execute(
+        select(
+            Schedule.id.label("schedule_id"),
+            Schedule.title.label("schedule_title"),
+            Detail.id.label("detail_id"),
+            Detail.content.label("detail_content"),
+            File.original_filename,
+            File.filename_with_timestamp,
+        )
+        .outerjoin(Detail, Detail.schedule_id == Schedule.id)
+        .outerjoin(detail_file, detail_file.c.detail_id == Detail.id)
+        .outerjoin(File, File.id == detail_file.c.file_id)
+        .where(schedule_filter)
+        .order_by(Schedule.id, Detail.id, File.id)
+    ).all()
+
+    schedules = []
+    for (schedule_id, schedule_title), schedule_rows in groupby(
+        rows, key=lambda r: (r.schedule_id, r.schedule_title)
+    ):
+        details = []
+        for (detail_id, detail_content), detail_rows in groupby(
+            schedule_rows, key=lambda r: (r.detail_id, r.detail_content)
+        ):
+            if detail_id is None:  # 此議程沒有細項
+                continue
+            files = [r for r in detail_rows if r.filename_with_timestamp is not None]
+            details.append(
+                {
+                    "id": detail_id,
+                    "content": detail_content,
+                    "file_name": [f.original_filename for f in files],
+                    "file_urls": [
+                        S3_URL_PREFIX + f.filename_with_timestamp for f in files
+                    ],
+                }
+            )
+        schedules.append(
+            {"id": schedule_id, "title": schedule_title, "details": details}
+        )
+    return schedules
+
+
+def strict_loading():
+    # 開發模式下禁止未預先載入的 lazy load，讓漏網的 N+1 查詢直接報錯
+    return [raiseload("*")] if app.debug else []
 
 
 def getMeetContentFromDB(Table, id, is_record):
-    table = db.session.query(Table).get(id)
+    table = db.session.get(Table, id)
     if not table:
         return []
 
@@ -491,44 +923,81 @@ def getMeetContentFromDB(Table, id, is_record):
         "chairman": table.chairman,
         "recorder": table.recorder,
         "meeting_transcript": (
-            f"https://{S3_BUCKET}.s3.{S3_REGION}.amazonaws.com/{table.video}"
+            S3_URL_PREFIX + table.meeting_transcript
             if table.meeting_transcript
             else table.meeting_transcript
         ),
     }
     if table.upload_type == "file":
         if table.video:
-            table_data["video"] = (
-                f"https://{S3_BUCKET}.s3.{S3_REGION}.amazonaws.com/{table.video}"
-            )
+            table_data["video"] = S3_URL_PREFIX + table.video
         else:
             table_data["video"] = table.video
     elif table.upload_type == "link":
         table_data["video"] = table.video
 
-    # 預先載入每個 schedule 的 details 和每個 detail 的 files
-    filter_kwargs = (
-        {"record_id": table.id} if is_record else {"notification_id": table.id}
-    )
-    schedules = (
-        Schedule.query.filter_by(**filter_kwargs)
-        .options(joinedload(Schedule.details).joinedload(Detail.files))
-        .all()
-    )
-
-    table_data["schedules"] = [serialize_schedule(sched) for sched in schedules]
+    table_data["schedules"] = getSchedulesFromDB(table.id, is_record)
     result.append(table_data)
     return result
 
 
 def parse_json_field(request, field_name):
     try:
-        return json.loads(request.form.get(field_name, "{}"))
-    except json.JSONDecodeError:
-        print(f"JSON decode error for field: {field_name}")
+        return orjson.loads(request.form.get(field_name, "{}"))
+    except orjson.JSONDecodeError:
+        logger.warning("JSON decode error for field: %s", field_name)
         return {}
 
 
+def _file_size(file):
+    # 表單中的檔案通常沒有 Content-Length，改由 stream 尾端位置取得大小
+    if file.content_length:
+        return file.content_length
+    stream = file.stream
+    position = stream.tell()
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(position)
+    return size
+
+
+def _upload_one(kind, key, file, safe):
+    # 在執行緒中上傳單一檔案，回傳 (種類, 欄位名稱, 原始檔名, 儲存檔名)
+    if crt_manager:
+        crt_manager.upload(
+            fileobj=file,
+            bucket=S3_BUCKET,
+            key=safe,
+            extra_args={"ACL": "public-read"},
+        ).result()
+    else:
+        cfg = BIG_CFG if _file_size(file) > MULTIPART_THRESHOLD else SMALL_CFG
+        s3.upload_fileobj(
+            file, S3_BUCKET, safe, ExtraArgs={"ACL": "public-read"}, Config=cfg
+        )
+    return kind, key, file.filename, safe
+
+
+# 通知 / 紀錄共用的欄位，編輯時一次 UPDATE
+MEET_FIELDS = (
+    "title",
+    "session",
+    "datestart",
+    "dateend",
+    "place",
+    "person",
+    "shorthand",
+    "present",
+    "attendance",
+    "is_visible",
+    "meeting_transcript",
+    "upload_type",
+    "chairman",
+    "recorder",
+    "video",
+)
+
+
 def getDataFromFrontend(request):
     is_visible = request.form.get("is_visible")
     data = {
@@ -555,41 +1024,42 @@ def getDataFromFrontend(request):
     # else:
     #     video_file = request.files.get('videoFile')
     uploaded_files_info = {}
-    # 上傳檔案
+    # 先決定每個檔案的存放名稱（需查詢資料庫）
+    uploads = []
     for key in request.files:
+        file = request.files[key]
         if key.startswith("newfile-"):
-            file = request.files[key]
-            original = file.filename
-            safe = generate_unique_filename(original)
-            try:
-                s3.upload_fileobj(
-                    file, S3_BUCKET, safe, ExtraArgs={"ACL": "public-read"}
-                )
-                uploaded_files_info[original] = {
-                    "original": original,
-                    "safe": safe,
-                }
-            except Exception as e:
-                print(e, "  上傳失敗")
+            kind = "newfile"
+            safe = generate_unique_filename(file.filename)
         elif key.startswith("MeetingTranscript"):
-            file = request.files[key]
-            try:
-                s3.upload_fileobj(
-                    file, S3_BUCKET, file.filename, ExtraArgs={"ACL": "public-read"}
-                )
-                data["meeting_transcript"] = file.filename
-            except Exception as e:
-                print(e, "  上傳失敗")
+            kind = "meeting_transcript"
+            safe = file.filename
         elif key.startswith("videoFile"):
-            file = request.files[key]
-            try:
-                s3.upload_fileobj(
-                    file, S3_BUCKET, file.filename, ExtraArgs={"ACL": "public-read"}
-                )
-                data["video"] = file.filename
-            except Exception as e:
-                print(e, "  上傳失敗")
-            print(f"影音檔案 {key}: {file.filename}")
+            kind = "video"
+            safe = file.filename
+            logger.debug("影音檔案 %s: %s", key, file.filename)
+        else:
+            continue
+        uploads.append((kind, key, file, safe))
+    # 查詢完先結束交易，上傳 S3 的期間不佔用資料庫連線，之後的寫入也能開新交易
+    db.session.commit()
+
+    # 上傳檔案（並行送出，全部完成後再整理結果）
+    futures = [upload_executor.submit(_upload_one, *upload) for upload in uploads]
+
+    for future in as_completed(futures):
+        try:
+            kind, key, original, safe = future.result()
+        except Exception:
+            logger.exception("上傳失敗")
+            continue
+        if kind == "newfile":
+            uploaded_files_info[original] = {
+                "original": original,
+                "safe": safe,
+            }
+        else:
+            data[kind] = safe
 
     deleted_files = []
     content = parse_json_field(request, "content")
@@ -615,138 +1085,273 @@ def getDataFromFrontend(request):
     return data, deleted_files
 
 
-def addSchedule(content, id, is_record):
-    st_time = time.time()
-    for schedule in content:
-        # 動態決定欄位
-        schedule_kwargs = {
-            "title": schedule["title"],
-            "notification_id": None if is_record else id,
-            "record_id": id if is_record else None,
-        }
-        schedule_obj = Schedule(**schedule_kwargs)
-        db.session.add(schedule_obj)
-        db.session.flush()
+def bulk_insert_ids(Model, rows):
+    # 一次 INSERT 多筆並依輸入順序取回主鍵
+    if not rows:
+        return []
+    return db.session.scalars(
+        insert(Model).returning(Model.id, sort_by_parameter_order=True), rows
+    ).all()
+
+
+def upsert_children(Model, parent_key, groups):
+    # 依位置比對既有子項：沿用舊 id 批次 UPDATE，不足的批次 INSERT，多出的交給呼叫端刪除
+    fk = getattr(Model, parent_key)
+    existing = {}
+    parent_ids = [parent_id for parent_id, _ in groups]
+    if parent_ids:
+        for parent_id, child_id in db.session.execute(
+            select(fk, Model.id).where(fk.in_(parent_ids)).order_by(fk, Model.id)
+        ):
+            existing.setdefault(parent_id, []).append(child_id)
+
+    ids, updates, inserts, insert_pos, stale = [], [], [], [], []
+    for parent_id, rows in groups:
+        old_ids = existing.get(parent_id, [])
+        for i, row in enumerate(rows):
+            row = {**row, parent_key: parent_id}
+            if i < len(old_ids):
+                updates.append({**row, "id": old_ids[i]})
+                ids.append(old_ids[i])
+            else:
+                insert_pos.append(len(ids))
+                inserts.append(row)
+                ids.append(None)
+        stale.extend(old_ids[len(rows) :])
+
+    if updates:
+        db.session.execute(update(Model), updates)
+    for pos, new_id in zip(insert_pos, bulk_insert_ids(Model, inserts)):
+        ids[pos] = new_id
+    return ids, stale
+
+
+def link_detail_files(details, detail_ids):
+    # 一次查出所有已存在的檔案，避免每個檔案各查一次
+    all_safes = {
+        file_item["safe"]
+        for detail in details
+        for file_item in detail.get("file_urls", [])
+    }
+    file_ids = {}
+    if all_safes:
+        file_ids = dict(
+            db.session.execute(
+                select(File.filename_with_timestamp, File.id).where(
+                    File.filename_with_timestamp.in_(all_safes)
+                )
+            ).all()
+        )
+    # 只新增資料庫中還沒有的檔案
+    new_files = {}
+    for detail in details:
+        for file_item in detail.get("file_urls", []):
+            if file_item["safe"] not in file_ids:
+                new_files.setdefault(
+                    file_item["safe"],
+                    {
+                        "original_filename": file_item["original"],
+                        "filename_with_timestamp": file_item["safe"],
+                    },
+                )
+    file_ids.update(zip(new_files, bulk_insert_ids(File, list(new_files.values()))))
 
-        for detail in schedule["details"]:
-            detail_obj = Detail(
-                content=detail["content"],
-                schedule_id=schedule_obj.id,
-            )
-            db.session.add(detail_obj)
-            db.session.flush()
-
-            for file_item in detail.get("file_urls", []):
-                # 檢查是否已有此檔案
-                file_obj = File.query.filter_by(
-                    filename_with_timestamp=file_item["safe"]
-                ).first()
-
-                if not file_obj:
-                    file_obj = File(
-                        original_filename=file_item["original"],
-                        filename_with_timestamp=file_item["safe"],
-                    )
-                    db.session.add(file_obj)
-                    db.session.flush()
-
-                db.session.execute(
-                    detail_file.insert().values(
-                        detail_id=detail_obj.id, file_id=file_obj.id
-                    )
+    # 關聯表只寫入差異：多的刪掉、少的補上
+    new_pairs = {
+        (detail_id, file_ids[file_item["safe"]])
+        for detail, detail_id in zip(details, detail_ids)
+        for file_item in detail.get("file_urls", [])
+    }
+    old_pairs = set()
+    if detail_ids:
+        old_pairs = {
+            tuple(row)
+            for row in db.session.execute(
+                select(detail_file.c.detail_id, detail_file.c.file_id).where(
+                    detail_file.c.detail_id.in_(detail_ids)
                 )
-    db.session.commit()
-    print(
-        "更新/新增議程 id = ",
+            )
+        }
+    removed = old_pairs - new_pairs
+    if removed:
+        db.session.execute(
+            delete(detail_file).where(
+                tuple_(detail_file.c.detail_id, detail_file.c.file_id).in_(removed)
+            )
+        )
+    added = new_pairs - old_pairs
+    if added:
+        db.session.execute(
+            detail_file.insert(),
+            [{"detail_id": d, "file_id": f} for d, f in sorted(added)],
+        )
+
+
+def upsertSchedule(content, id, deleted_files, is_record):
+    st_time = time.time()
+    parent_key = "record_id" if is_record else "notification_id"
+    if deleted_files:
+        delete_unused_files(getattr(Schedule, parent_key) == id, deleted_files)
+
+    # 議程 -> 細項 逐層比對，每層最多一個 UPDATE、一個 INSERT
+    schedule_ids, stale_schedules = upsert_children(
+        Schedule,
+        parent_key,
+        [(id, [{"title": schedule["title"]} for schedule in content])],
+    )
+    details = [detail for schedule in content for detail in schedule["details"]]
+    detail_ids, stale_details = upsert_children(
+        Detail,
+        "schedule_id",
+        [
+            (schedule_id, [{"content": d["content"]} for d in schedule["details"]])
+            for schedule, schedule_id in zip(content, schedule_ids)
+        ],
+    )
+
+    # 多出來的議程、細項由下而上刪除
+    if stale_schedules or stale_details:
+        dead_detail = or_(
+            Detail.id.in_(stale_details), Detail.schedule_id.in_(stale_schedules)
+        )
+        for stmt in (
+            delete(detail_file).where(
+                detail_file.c.detail_id.in_(select(Detail.id).where(dead_detail))
+            ),
+            delete(Detail).where(dead_detail),
+            delete(Schedule).where(Schedule.id.in_(stale_schedules)),
+        ):
+            db.session.execute(stmt, execution_options={"synchronize_session": False})
+
+    link_detail_files(details, detail_ids)
+    logger.debug(
+        "更新/新增議程 id = %s 是否為紀錄: %s 花費時間: %.3f",
         id,
-        " 是否為紀錄:",
         is_record,
-        " 花費時間:",
         time.time() - st_time,
     )
 
 
-def delete_file_if_unused(file, deleted_files_set):
-    """
-    如果檔案只被一個 detail 使用，且在刪除清單中，就從 S3 與資料庫中刪除。
-    """
-    if len(file.details) == 1 and file.filename_with_timestamp in deleted_files_set:
+def delete_s3_objects(keys):
+    # 批次刪除 S3 檔案，delete_objects 每次最多 1000 個 key
+    for i in range(0, len(keys), 1000):
         try:
             s3_time = time.time()
-            s3.delete_object(Bucket=S3_BUCKET, Key=file.filename_with_timestamp)
-            print("s3", file.filename_with_timestamp, time.time() - s3_time)
-        except Exception as e:
-            print("刪除 S3 失敗：", e)
-        db.session.delete(file)
-
-
-def deletSchedule(id, deleted_files, is_record):
-    st_time = time.time()
-    schedule_filter = (
-        Schedule.record_id == id if is_record else Schedule.notification_id == id
+            response = s3.delete_objects(
+                Bucket=S3_BUCKET,
+                Delete={
+                    "Objects": [{"Key": key} for key in keys[i : i + 1000]],
+                    "Quiet": True,
+                },
+            )
+            for error in response.get("Errors", []):
+                logger.warning("刪除 S3 失敗：%s %s", error["Key"], error["Message"])
+            logger.debug(
+                "s3 %d 個檔案 %.3f", len(keys[i : i + 1000]), time.time() - s3_time
+            )
+        except Exception:
+            logger.exception("刪除 S3 失敗")
+
+
+def delete_schedules(schedule_filter):
+    # 由下而上刪除議程、細項與檔案關聯，每層一個 DELETE，不必把整棵樹載入
+    schedule_ids = select(Schedule.id).where(schedule_filter)
+    detail_ids = select(Detail.id).where(Detail.schedule_id.in_(schedule_ids))
+    for stmt in (
+        delete(detail_file).where(detail_file.c.detail_id.in_(detail_ids)),
+        delete(Detail).where(Detail.schedule_id.in_(schedule_ids)),
+        delete(Schedule).where(schedule_filter),
+    ):
+        db.session.execute(stmt, execution_options={"synchronize_session": False})
+
+
+def delete_unused_files(schedule_filter, deleted_files):
+    dele_time = time.time()
+    # 直接查出此會議中、列在刪除清單內的檔案
+    candidates = db.session.execute(
+        select(File.id, File.filename_with_timestamp)
+        .join(detail_file, detail_file.c.file_id == File.id)
+        .join(Detail, Detail.id == detail_file.c.detail_id)
+        .join(Schedule, Schedule.id == Detail.schedule_id)
+        .where(
+            schedule_filter,
+            File.filename_with_timestamp.in_(set(deleted_files)),
+        )
+        .distinct()
+    ).all()
+    if not candidates:
+        return
+    # 一次聚合查詢每個檔案被幾個 detail 使用，只刪除僅被使用一次的檔案
+    counts = dict(
+        db.session.execute(
+            select(detail_file.c.file_id, func.count())
+            .where(detail_file.c.file_id.in_([f.id for f in candidates]))
+            .group_by(detail_file.c.file_id)
+        ).all()
     )
-    old_schedules = Schedule.query.filter(schedule_filter).all()
-    if not old_schedules:
-        print("刪議程,此id=", id, "沒有議程 紀錄:", is_record)
+    files_to_delete = [f for f in candidates if counts.get(f.id, 0) == 1]
+    if not files_to_delete:
         return
-    for sched in old_schedules:
-        dele_time = time.time()
-        if deleted_files:
-            for detail in sched.details:
-                for file in detail.files:
-                    delete_file_if_unused(file, deleted_files)
-            print("全部刪檔案", time.time() - dele_time)
-        db.session.delete(sched)
-    db.session.commit()
-    print("刪議程,id=", id, " 紀錄:", is_record, " 花費時間:", time.time() - st_time)
+    # S3 一次批次刪除，再刪資料庫紀錄
+    delete_s3_objects([f.filename_with_timestamp for f in files_to_delete])
+    file_ids = [f.id for f in files_to_delete]
+    db.session.execute(delete(detail_file).where(detail_file.c.file_id.in_(file_ids)))
+    db.session.execute(
+        delete(File).where(File.id.in_(file_ids)),
+        execution_options={"synchronize_session": False},
+    )
+    logger.debug("全部刪檔案 %.3f", time.time() - dele_time)
 
 
-def getAllRegulationTitleFromDB(Table, only_visible: bool = False):
-    category_ordering = {
-        "憲制性法規篇": 1,
-        "綜合法規篇": 2,
-        "行政部門篇": 3,
-        "立法部門篇": 4,
-        "司法部門篇": 5,
-        "附錄篇": 6,
-    }
+# 規章分類的固定排序；CASE 只建一次，SQLAlchemy 的編譯快取可以重複使用
+_CATEGORY_ORDERING = {
+    "憲制性法規篇": 1,
+    "綜合法規篇": 2,
+    "行政部門篇": 3,
+    "立法部門篇": 4,
+    "司法部門篇": 5,
+    "附錄篇": 6,
+}
+_CATEGORY_CASE = case(
+    *[
+        (Regulation.category == name, order)
+        for name, order in _CATEGORY_ORDERING.items()
+    ],
+    else_=100,
+)
 
-    category_order = case(
-        *[(Table.category == name, order) for name, order in category_ordering.items()],
-        else_=100,
-    )
 
-    query = db.session.query(Table)
+def _query_regulation_titles(Table, only_visible: bool = False):
+    # 只取列表需要的欄位，不建立 ORM 物件
+    query = select(Table.id, Table.title, Table.category, Table.is_visible)
     if only_visible:
-        query = query.filter(Table.is_visible == True)
+        query = query.where(Table.is_visible == True)
 
-    regulations = query.order_by(category_order, Table.id.asc()).all()
+    rows = db.session.execute(query.order_by(_CATEGORY_CASE, Table.id.asc())).all()
+    result = [row._asdict() for row in rows]
 
-    result = [
-        {
-            "id": r.id,
-            "title": r.title,
-            "category": r.category,
-            "is_visible": r.is_visible,
-        }
-        for r in regulations
-    ]
+    return result, list(_CATEGORY_ORDERING.keys())
 
-    return result, list(category_ordering.keys())
+
+# 未登入者的列表短期快取；管理者直接呼叫 _query_regulation_titles
+@cache.memoize(timeout=30)
+def getAllRegulationTitleFromDB(Table, only_visible: bool = False):
+    return _query_regulation_titles(Table, only_visible)
 
 
 def getRegulationContentFromDB(reg_id):
-    regulation = (
-        db.session.query(Regulation)
-        .options(
-            joinedload(Regulation.chapters)
-            .joinedload(Chapter.articles)
-            .joinedload(Article.paragraphs)
-            .joinedload(Paragraph.clauses),
-            joinedload(Regulation.revisions),
-        )
-        .filter(Regulation.id == reg_id)
-        .first()
+    # 每層一個 WHERE parent_id IN (...) 查詢，避免章/條/項/款與修訂紀錄相乘的大結果集
+    regulation = db.session.get(
+        Regulation,
+        reg_id,
+        options=[
+            selectinload(Regulation.chapters)
+            .selectinload(Chapter.articles)
+            .selectinload(Article.paragraphs)
+            .selectinload(Paragraph.clauses),
+            selectinload(Regulation.revisions),
+            *strict_loading(),
+        ],
     )
 
     if not regulation:
@@ -786,9 +1391,7 @@ def getRegulationContentFromDB(reg_id):
                             for para in article.paragraphs
                         ],
                     }
-                    for article in sorted(
-                        chapter.articles, key=lambda x: float(x.sort_index)
-                    )  # 排序
+                    for article in chapter.articles  # 已依 sort_index 排序
                 ],
             }
             for chapter in regulation.chapters
@@ -804,6 +1407,9 @@ def getRegulationContentFromDB(reg_id):
     }
 
 
+REGULATION_FIELDS = ("title", "category", "description", "is_visible")
+
+
 def getRegulationFromFrontend(request):
     is_visible = request.form.get("is_visible")
     data = {
@@ -817,88 +1423,128 @@ def getRegulationFromFrontend(request):
     return data
 
 
-def deletChapter(id):
-    st_time = time.time()
-    regulation = (
-        Regulation.query.options(
-            joinedload(Regulation.chapters)
-            .joinedload(Chapter.articles)
-            .joinedload(Article.paragraphs)
-            .joinedload(Paragraph.clauses),
-            joinedload(Regulation.revisions),
-        )
-        .filter_by(id=id)
-        .first()
-    )
-    if not regulation:
-        raise ValueError(f"Regulation id {id} not found.")
-    # 刪掉所有章節底下的資料
-    for chapter in regulation.chapters:
-        for article in chapter.articles:
-            for paragraph in article.paragraphs:
-                for clause in paragraph.clauses:
-                    db.session.delete(clause)
-                db.session.delete(paragraph)
-            db.session.delete(article)
-        db.session.delete(chapter)
-
-    # 刪掉修訂紀錄
-    for revision in regulation.revisions:
-        db.session.delete(revision)
+def delete_regulation_children(id):
+    # 刪掉所有章節底下的資料：由下而上每層一個 DELETE，不必把整棵樹載入
+    chapter_ids = select(Chapter.id).where(Chapter.regulation_id == id)
+    article_ids = select(Article.id).where(Article.chapter_id.in_(chapter_ids))
+    paragraph_ids = select(Paragraph.id).where(Paragraph.article_id.in_(article_ids))
+    for stmt in (
+        delete(Clause).where(Clause.paragraph_id.in_(paragraph_ids)),
+        delete(Paragraph).where(Paragraph.article_id.in_(article_ids)),
+        delete(Article).where(Article.chapter_id.in_(chapter_ids)),
+        delete(Chapter).where(Chapter.regulation_id == id),
+        # 刪掉修訂紀錄
+        delete(Revision).where(Revision.regulation_id == id),
+    ):
+        db.session.execute(stmt, execution_options={"synchronize_session": False})
 
-    db.session.commit()
-    print("刪章節,id=", id, " 花費時間:", time.time() - st_time)
 
-
-def addChapter(content, revision, regulation_id):
+def upsertChapter(content, revision, regulation_id):
     st_time = time.time()
-    # 新增章節
-    for chapter_data in content:
-        chapter = Chapter(
-            regulation_id=regulation_id,
-            title=chapter_data["title"],
-            number=chapter_data["number"],
-        )
-        db.session.add(chapter)
-        db.session.flush()  # 把 chapter.id 生出來給後面用
-
-        for article_data in chapter_data.get("articles", []):
-            article = Article(
-                chapter_id=chapter.id,
-                title=article_data["title"],
-                sort_index=article_data["sort_index"],
+    # 章 -> 條 -> 項 -> 款 逐層比對，每層最多一個 UPDATE、一個 INSERT
+    chapter_ids, stale_chapters = upsert_children(
+        Chapter,
+        "regulation_id",
+        [
+            (
+                regulation_id,
+                [{"title": c["title"], "number": c["number"]} for c in content],
+            )
+        ],
+    )
+    articles = [a for c in content for a in c.get("articles", [])]
+    article_ids, stale_articles = upsert_children(
+        Article,
+        "chapter_id",
+        [
+            (
+                chapter_id,
+                [
+                    {"title": a["title"], "sort_index": a["sort_index"]}
+                    for a in chapter_data.get("articles", [])
+                ],
+            )
+            for chapter_data, chapter_id in zip(content, chapter_ids)
+        ],
+    )
+    paragraphs = [p for a in articles for p in a.get("paragraphs", [])]
+    paragraph_ids, stale_paragraphs = upsert_children(
+        Paragraph,
+        "article_id",
+        [
+            (
+                article_id,
+                [
+                    {"number": p["number"], "content": p["content"]}
+                    for p in article_data.get("paragraphs", [])
+                ],
             )
-            db.session.add(article)
-            db.session.flush()
-
-            for paragraph_data in article_data.get("paragraphs", []):
-                paragraph = Paragraph(
-                    article_id=article.id,
-                    number=paragraph_data["number"],
-                    content=paragraph_data["content"],
+            for article_data, article_id in zip(articles, article_ids)
+        ],
+    )
+    _, stale_clauses = upsert_children(
+        Clause,
+        "paragraph_id",
+        [
+            (
+                paragraph_id,
+                [
+                    {"number": c["number"], "content": c["content"]}
+                    for c in paragraph_data.get("clauses", [])
+                ],
+            )
+            for paragraph_data, paragraph_id in zip(paragraphs, paragraph_ids)
+        ],
+    )
+    # 修訂紀錄
+    _, stale_revisions = upsert_children(
+        Revision,
+        "regulation_id",
+        [
+            (
+                regulation_id,
+                [
+                    {
+                        "modified_at": datetime.strptime(
+                            rev["date"], "%Y-%m-%d"
+                        ).date(),
+                        "note": rev["note"],
+                    }
+                    for rev in revision
+                ],
+            )
+        ],
+    )
+
+    # 多出來的節點連同子孫由下而上刪除
+    if any((stale_chapters, stale_articles, stale_paragraphs, stale_clauses)):
+        dead_article = or_(
+            Article.id.in_(stale_articles), Article.chapter_id.in_(stale_chapters)
+        )
+        dead_paragraph = or_(
+            Paragraph.id.in_(stale_paragraphs),
+            Paragraph.article_id.in_(select(Article.id).where(dead_article)),
+        )
+        for stmt in (
+            delete(Clause).where(
+                or_(
+                    Clause.id.in_(stale_clauses),
+                    Clause.paragraph_id.in_(select(Paragraph.id).where(dead_paragraph)),
                 )
-                db.session.add(paragraph)
-                db.session.flush()
-
-                for clause_data in paragraph_data.get("clauses", []):
-                    clause = Clause(
-                        paragraph_id=paragraph.id,
-                        number=clause_data["number"],
-                        content=clause_data["content"],
-                    )
-                    db.session.add(clause)
-
-    # 新增修訂紀錄
-    for rev in revision:
-        rev_obj = Revision(
-            regulation_id=regulation_id,
-            modified_at=datetime.strptime(rev["date"], "%Y-%m-%d").date(),
-            note=rev["note"],
+            ),
+            delete(Paragraph).where(dead_paragraph),
+            delete(Article).where(dead_article),
+            delete(Chapter).where(Chapter.id.in_(stale_chapters)),
+        ):
+            db.session.execute(stmt, execution_options={"synchronize_session": False})
+    if stale_revisions:
+        db.session.execute(
+            delete(Revision).where(Revision.id.in_(stale_revisions)),
+            execution_options={"synchronize_session": False},
         )
-        db.session.add(rev_obj)
-
-    db.session.commit()
-    print("新增章節,id=", id, " 花費時間:", time.time() - st_time)
+    logger.debug(
+        "更新/新增章節 id = %s 花費時間: %.3f", regulation_id, time.time() - st_time
+    )
 
 
 # 設定如何載入使用者
@@ -923,13 +1569,14 @@ def login():
         username = data.get("username")
         password = data.get("password")
         # 假設這裡直接從資料庫查詢使用者
-        user = User.query.filter_by(username=username).first()
-        if user and user.password == password:  # 驗證密碼
+        user = db.session.scalar(select(User).filter_by(username=username))
+        if user and check_password(user, password):  # 驗證密碼
             login_user(user)  # 登入使用者
-            print("帳密正確")
+            logger.debug("帳密正確")
             return jsonify({"success": True}), 200  # 登入後重定向到 admin 頁面
         else:
-            print("帳密錯誤")
+            # 不記錄輸入的帳號，避免把誤填在帳號欄的密碼寫進日誌
+            logger.info("帳密錯誤")
             return (
                 jsonify({"success": False, "message": "Invalid credentials"}),
                 401,
@@ -947,7 +1594,6 @@ def logout():
 
 @app.route("/notifi")
 def admin_notifi_page():
-    print(current_user.is_authenticated)
     return render_template("admin_notifi.html", editable=current_user.is_authenticated)
 
 
@@ -969,9 +1615,12 @@ def admin_notifi_data():
     try:
         # 根據是否登入決定是否顯示所有與是否可編輯
         is_authenticated = current_user.is_authenticated
-        result, session_list = getAllMeetTitleFromDB(
-            Notification, only_visible=not is_authenticated
-        )
+        if is_authenticated:
+            result, session_list = _query_meet_titles(Notification)
+        else:
+            result, session_list = getAllMeetTitleFromDB(
+                Notification, only_visible=True
+            )
         return (
             jsonify(
                 {
@@ -983,7 +1632,7 @@ def admin_notifi_data():
             200,
         )
     except Exception as e:
-        print("error", str(e))
+        logger.exception("%s 失敗", request.path)
         return jsonify({"error": str(e)}), 500
 
 
@@ -993,9 +1642,10 @@ def admin_record_data():
     try:
         # 根據是否登入決定是否顯示所有與是否可編輯
         is_authenticated = current_user.is_authenticated
-        result, session_list = getAllMeetTitleFromDB(
-            Record, only_visible=not is_authenticated
-        )
+        if is_authenticated:
+            result, session_list = _query_meet_titles(Record)
+        else:
+            result, session_list = getAllMeetTitleFromDB(Record, only_visible=True)
         return (
             jsonify(
                 {
@@ -1007,7 +1657,7 @@ def admin_record_data():
             200,
         )
     except Exception as e:
-        print("error", str(e))
+        logger.exception("%s 失敗", request.path)
         return jsonify({"error": str(e)}), 500
 
 
@@ -1016,9 +1666,12 @@ def admin_record_data():
 def admin_regulations_data():
     try:
         is_authenticated = current_user.is_authenticated
-        result, category_list = getAllRegulationTitleFromDB(
-            Regulation, only_visible=not is_authenticated
-        )
+        if is_authenticated:
+            result, category_list = _query_regulation_titles(Regulation)
+        else:
+            result, category_list = getAllRegulationTitleFromDB(
+                Regulation, only_visible=True
+            )
         return (
             jsonify(
                 {
@@ -1030,7 +1683,7 @@ def admin_regulations_data():
             200,
         )
     except Exception as e:
-        print("error", str(e))
+        logger.exception("%s 失敗", request.path)
         return jsonify({"error": str(e)}), 500
 
 
@@ -1043,7 +1696,7 @@ def admin_notifi_getdetail(id):
             return jsonify({"notifications": result}), 200
         return jsonify({"error": "找不到此通知"}), 404
     except Exception as e:
-        print("error", str(e))
+        logger.exception("%s 失敗", request.path)
         return jsonify({"error": str(e)}), 500
 
 
@@ -1056,7 +1709,7 @@ def admin_record_getdetail(id):
             return jsonify({"records": result}), 200
         return jsonify({"error": "找不到此通知"}), 500
     except Exception as e:
-        print("error", str(e))
+        logger.exception("%s 失敗", request.path)
         return jsonify({"error": str(e)}), 500
 
 
@@ -1069,7 +1722,7 @@ def admin_regulations_getdetail(id):
             return jsonify({"regulations": result}), 200
         return jsonify({"error": "找不到此通知"}), 404
     except Exception as e:
-        print("error", str(e))
+        logger.exception("%s 失敗", request.path)
         return jsonify({"error": str(e)}), 500
 
 
@@ -1078,55 +1731,44 @@ def admin_regulations_getdetail(id):
 def upload_notifi():
     try:
         not_time = time.time()
+        # getDataFromFrontend 會先結束目前的交易再上傳 S3
+        user_id = current_user.id
         data, deleted_files = getDataFromFrontend(request)
 
-        record = None
         noti_id = request.form.get("id")
         is_new = noti_id == "-1"
+        payload = {field: data[field] for field in MEET_FIELDS}
+        logger.debug("主席 %s 紀錄 %s", data["chairman"], data["recorder"])
+
+        # 所有寫入在同一個交易內，離開區塊時 commit、發生例外時 rollback
+        with db.session.begin():
+            # 新增用 INSERT ... RETURNING 取回 id；修改直接下單一 UPDATE
+            if is_new:
+                logger.debug("新增通知")
+                noti_id = db.session.scalar(
+                    insert(Notification)
+                    .values(user_id=user_id, **payload)
+                    .returning(Notification.id)
+                )
+            else:
+                logger.debug("修改通知 id = %s", noti_id)
+                noti_id = int(noti_id)
+                result = db.session.execute(
+                    update(Notification)
+                    .where(Notification.id == noti_id)
+                    .values(**payload)
+                )
+                if result.rowcount == 0:
+                    return {"error": "找不到通知資料"}, 404
+            upsertSchedule(data["content"], noti_id, deleted_files, is_record=False)
 
-        # 建立或取得 Notification
-        if is_new:
-            print("新增通知")
-            notification = Notification(user_id=current_user.id)
-            db.session.add(notification)
-        else:
-            print(f"修改通知 id = {noti_id}")
-            notification = Notification.query.get(noti_id)
-            if not notification:
-                return {"error": "找不到通知資料"}, 404
-        # 通用欄位
-        print(data["chairman"], data["recorder"])
-
-        for field in [
-            "title",
-            "session",
-            "datestart",
-            "dateend",
-            "place",
-            "person",
-            "shorthand",
-            "present",
-            "attendance",
-            "is_visible",
-            "meeting_transcript",
-            "upload_type",
-            "chairman",
-            "recorder",
-            "video",
-        ]:
-            setattr(notification, field, data[field])
-        db.session.flush()
-        if not is_new:
-            deletSchedule(notification.id, deleted_files, is_record=False)
-        addSchedule(data["content"], notification.id, is_record=False)
-
-        db.session.commit()
-        print("完成", time.time() - not_time)
+        clear_list_cache()
+        logger.debug("完成 %.3f", time.time() - not_time)
 
-        return admin_notifi_data()
+        return jsonify({"id": noti_id}), 200
     except Exception as e:
         db.session.rollback()
-        print(str(e))
+        logger.exception("%s 失敗", request.path)
         return jsonify({"error": str(e)}), 500
 
 
@@ -1135,57 +1777,42 @@ def upload_notifi():
 def upload_record():
     try:
         record_time = time.time()
+        # getDataFromFrontend 會先結束目前的交易再上傳 S3
+        user_id = current_user.id
         data, deleted_files = getDataFromFrontend(request)
         record_id = request.form.get("id")
 
         is_new = record_id == "-1"
-        if is_new:
-            print("新增紀錄")
-            record = Record(
-                user_id=current_user.id,
-                is_modify=True,
-            )
-            db.session.add(record)
-        else:
-            print(f"修改紀錄 id = {record_id}")
-            record = Record.query.get(record_id)
-            if not record:
-                return {"error": "找不到紀錄資料"}, 404
-            record.is_modify = True
-        # 通用欄位填入
-        print(data["chairman"], data["recorder"])
-        for field in [
-            "title",
-            "session",
-            "datestart",
-            "dateend",
-            "place",
-            "person",
-            "shorthand",
-            "present",
-            "attendance",
-            "is_visible",
-            "meeting_transcript",
-            "upload_type",
-            "chairman",
-            "recorder",
-            "video",
-        ]:
-
-            setattr(record, field, data[field])
-        db.session.flush()
-
-        if not is_new:
-            deletSchedule(record.id, deleted_files, is_record=True)
-
-        addSchedule(data["content"], record.id, is_record=True)
-        db.session.commit()
-        print("完成", time.time() - record_time)
+        payload = {field: data[field] for field in MEET_FIELDS}
+        logger.debug("主席 %s 紀錄 %s", data["chairman"], data["recorder"])
+
+        # 所有寫入在同一個交易內，離開區塊時 commit、發生例外時 rollback
+        with db.session.begin():
+            # 新增用 INSERT ... RETURNING 取回 id；修改直接下單一 UPDATE
+            if is_new:
+                logger.debug("新增紀錄")
+                record_id = db.session.scalar(
+                    insert(Record)
+                    .values(user_id=user_id, **payload)
+                    .returning(Record.id)
+                )
+            else:
+                logger.debug("修改紀錄 id = %s", record_id)
+                record_id = int(record_id)
+                result = db.session.execute(
+                    update(Record).where(Record.id == record_id).values(**payload)
+                )
+                if result.rowcount == 0:
+                    return {"error": "找不到紀錄資料"}, 404
+            upsertSchedule(data["content"], record_id, deleted_files, is_record=True)
 
-        return admin_record_data()
+        clear_list_cache()
+        logger.debug("完成 %.3f", time.time() - record_time)
+
+        return jsonify({"id": record_id}), 200
     except Exception as e:
         db.session.rollback()
-        print(str(e))
+        logger.exception("%s 失敗", request.path)
         return jsonify({"error": str(e)}), 500
 
 
@@ -1194,42 +1821,44 @@ def upload_record():
 def upload_regulation():
     try:
         record_time = time.time()
+        # 先結束載入使用者時開啟的交易，上傳 S3 的期間不佔用資料庫連線
+        user_id = current_user.id
+        db.session.commit()
         data = getRegulationFromFrontend(request)
         regulation_id = request.form.get("id")
 
         is_new = regulation_id == "-1"
-        print("current_user.id", current_user.id)
-        if is_new:
-            print("新增規章")
-            regulation = Regulation(
-                user_id=current_user.id,
-            )
-            db.session.add(regulation)
-        else:
-            print(f"修改規章 id = {regulation_id}")
-            regulation = Regulation.query.get(regulation_id)
-            if not regulation:
-                return {"error": "找不到紀錄資料"}, 404
-        # 通用欄位填入
-        for field in [
-            "title",
-            "category",
-            "description",
-            "is_visible",
-        ]:
-            setattr(regulation, field, data[field])
-        db.session.flush()
-
-        if not is_new:
-            deletChapter(regulation.id)
-        addChapter(data["content"], data["revision"], regulation.id)
-        db.session.commit()
-        print("完成", time.time() - record_time)
+        logger.debug("current_user.id %s", user_id)
+        payload = {field: data[field] for field in REGULATION_FIELDS}
+        # 所有寫入在同一個交易內，離開區塊時 commit、發生例外時 rollback
+        with db.session.begin():
+            # 新增用 INSERT ... RETURNING 取回 id；修改直接下單一 UPDATE
+            if is_new:
+                logger.debug("新增規章")
+                regulation_id = db.session.scalar(
+                    insert(Regulation)
+                    .values(user_id=user_id, **payload)
+                    .returning(Regulation.id)
+                )
+            else:
+                logger.debug("修改規章 id = %s", regulation_id)
+                regulation_id = int(regulation_id)
+                result = db.session.execute(
+                    update(Regulation)
+                    .where(Regulation.id == regulation_id)
+                    .values(**payload)
+                )
+                if result.rowcount == 0:
+                    return {"error": "找不到紀錄資料"}, 404
+            upsertChapter(data["content"], data["revision"], regulation_id)
 
-        return admin_regulations_data()
+        clear_list_cache()
+        logger.debug("完成 %.3f", time.time() - record_time)
+
+        return jsonify({"id": regulation_id}), 200
     except Exception as e:
         db.session.rollback()
-        print(str(e))
+        logger.exception("%s 失敗", request.path)
         return jsonify({"error": str(e)}), 500
 
 
@@ -1239,18 +1868,24 @@ def delete_notifi():
     try:
         notifi_id = request.form.get("id")
         if notifi_id:
-            notification = Notification.query.get(notifi_id)
-            if notification:
-                db.session.delete(notification)
-                db.session.commit()
-                return admin_notifi_data()
-            else:
+            notifi_id = int(notifi_id)
+            # 子表由下而上直接刪除，主表一個 DELETE，用 rowcount 判斷是否存在
+            delete_schedules(Schedule.notification_id == notifi_id)
+            result = db.session.execute(
+                delete(Notification).where(Notification.id == notifi_id),
+                execution_options={"synchronize_session": False},
+            )
+            if result.rowcount == 0:
+                db.session.rollback()
                 return jsonify({"error": "找不到通知資料"}), 404
+            db.session.commit()
+            clear_list_cache()
+            return jsonify({"deleted": notifi_id}), 200
         else:
             return jsonify({"error": "缺少通知 ID"}), 400
     except Exception as e:
         db.session.rollback()
-        print(str(e))
+        logger.exception("%s 失敗", request.path)
         return jsonify({"error": str(e)}), 500
 
 
@@ -1260,18 +1895,24 @@ def delete_record():
     try:
         record_id = request.form.get("id")
         if record_id:
-            record = Record.query.get(record_id)
-            if record:
-                db.session.delete(record)
-                db.session.commit()
-                return admin_record_data()
-            else:
+            record_id = int(record_id)
+            # 子表由下而上直接刪除，主表一個 DELETE，用 rowcount 判斷是否存在
+            delete_schedules(Schedule.record_id == record_id)
+            result = db.session.execute(
+                delete(Record).where(Record.id == record_id),
+                execution_options={"synchronize_session": False},
+            )
+            if result.rowcount == 0:
+                db.session.rollback()
                 return jsonify({"error": "找不到紀錄資料"}), 404
+            db.session.commit()
+            clear_list_cache()
+            return jsonify({"deleted": record_id}), 200
         else:
             return jsonify({"error": "缺少紀錄 ID"}), 400
     except Exception as e:
         db.session.rollback()
-        print(str(e))
+        logger.exception("%s 失敗", request.path)
         return jsonify({"error": str(e)}), 500
 
 
@@ -1281,18 +1922,24 @@ def delete_regulation():
     try:
         regulation_id = request.form.get("id")
         if regulation_id:
-            regulation = Regulation.query.get(regulation_id)
-            if regulation:
-                db.session.delete(regulation)
-                db.session.commit()
-                return admin_regulations_data()
-            else:
+            regulation_id = int(regulation_id)
+            # 子表由下而上直接刪除，主表一個 DELETE，用 rowcount 判斷是否存在
+            delete_regulation_children(regulation_id)
+            result = db.session.execute(
+                delete(Regulation).where(Regulation.id == regulation_id),
+                execution_options={"synchronize_session": False},
+            )
+            if result.rowcount == 0:
+                db.session.rollback()
                 return jsonify({"error": "找不到規章資料"}), 404
+            db.session.commit()
+            clear_list_cache()
+            return jsonify({"deleted": regulation_id}), 200
         else:
             return jsonify({"error": "缺少規章 ID"}), 400
     except Exception as e:
         db.session.rollback()
-        print(str(e))
+        logger.exception("%s 失敗", request.path)
         return jsonify({"error": str(e)}), 500
 
 
@@ -1312,41 +1959,96 @@ def viewer_regulations_page():
 
 
 @app.route("/viewer/notifi/data")
+@conditional_get(Notification)
+# 只快取預設的第一頁；其他分頁走 keyset 查詢
+@cache.cached(
+    timeout=300,
+    key_prefix=viewer_cache_key,
+    unless=lambda: bool(request.args),
+    response_filter=is_ok_response,
+)
 def viewer_notifi_data():
     try:
-        result, session_list = getAllMeetTitleFromDB(Notification, only_visible=True)
-        return jsonify({"notifications": result, "session_list": session_list}), 200
+        before, before_id, limit = parse_page_args(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    try:
+        result, session_list, next_cursor = getMeetTitlePageFromDB(
+            Notification, g.viewer_version, before, before_id, limit
+        )
+        return (
+            jsonify(
+                {
+                    "notifications": result,
+                    "session_list": session_list,
+                    "next_cursor": next_cursor,
+                }
+            ),
+            200,
+        )
     except Exception as e:
-        print("error", str(e))
+        logger.exception("%s 失敗", request.path)
         return jsonify({"error": str(e)}), 500
 
 
 @app.route("/viewer/minutes/data")
+@conditional_get(Record)
+# 只快取預設的第一頁；其他分頁走 keyset 查詢
+@cache.cached(
+    timeout=300,
+    key_prefix=viewer_cache_key,
+    unless=lambda: bool(request.args),
+    response_filter=is_ok_response,
+)
 def viewer_record_data():
     try:
-        result, session_list = getAllMeetTitleFromDB(Record, only_visible=True)
-        return jsonify({"records": result, "session_list": session_list}), 200
+        before, before_id, limit = parse_page_args(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    try:
+        result, session_list, next_cursor = getMeetTitlePageFromDB(
+            Record, g.viewer_version, before, before_id, limit
+        )
+        return (
+            jsonify(
+                {
+                    "records": result,
+                    "session_list": session_list,
+                    "next_cursor": next_cursor,
+                }
+            ),
+            200,
+        )
     except Exception as e:
-        print("error", str(e))
+        logger.exception("%s 失敗", request.path)
         return jsonify({"error": str(e)}), 500
 
 
 @app.route("/viewer/regulations/data")
+@conditional_get(Regulation)
+@cache.cached(timeout=300, key_prefix=viewer_cache_key, response_filter=is_ok_response)
 def viewer_regulations_data():
     try:
-        result, category_list = getAllRegulationTitleFromDB(
-            Regulation, only_visible=True
-        )
+        # 整個回應已存進共用快取，直接查詢，不再經過列表快取
+        result, category_list = _query_regulation_titles(Regulation, only_visible=True)
         return (
             jsonify({"regulations": result, "category_list": category_list}),
             200,
         )
     except Exception as e:
-        print("error", str(e))
+        logger.exception("%s 失敗", request.path)
         return jsonify({"error": str(e)}), 500
 
 
 @app.route("/viewer/notifi/data/<int:id>", methods=["GET"])
+@conditional_get(Notification)
+# 找不到資料時沒有版本，不經過快取
+@cache.cached(
+    timeout=300,
+    key_prefix=viewer_cache_key,
+    unless=lambda: "viewer_etag" not in g,
+    response_filter=is_ok_response,
+)
 def viewer_notifi_getdetail(id):
     try:
         result = getMeetContentFromDB(Notification, id, 0)
@@ -1354,11 +2056,19 @@ def viewer_notifi_getdetail(id):
             return jsonify({"notifications": result}), 200
         return jsonify({"error": "找不到此通知"}), 404
     except Exception as e:
-        print("error", str(e))
+        logger.exception("%s 失敗", request.path)
         return jsonify({"error": str(e)}), 500
 
 
 @app.route("/viewer/minutes/data/<int:id>", methods=["GET"])
+@conditional_get(Record)
+# 找不到資料時沒有版本，不經過快取
+@cache.cached(
+    timeout=300,
+    key_prefix=viewer_cache_key,
+    unless=lambda: "viewer_etag" not in g,
+    response_filter=is_ok_response,
+)
 def viewer_record_getdetail(id):
     try:
         result = getMeetContentFromDB(Record, id, 1)
@@ -1366,11 +2076,19 @@ def viewer_record_getdetail(id):
             return jsonify({"records": result}), 200
         return jsonify({"error": "找不到此通知"}), 500
     except Exception as e:
-        print("error", str(e))
+        logger.exception("%s 失敗", request.path)
         return jsonify({"error": str(e)}), 500
 
 
 @app.route("/viewer/regulations/data/<int:id>", methods=["GET"])
+@conditional_get(Regulation)
+# 找不到資料時沒有版本，不經過快取
+@cache.cached(
+    timeout=300,
+    key_prefix=viewer_cache_key,
+    unless=lambda: "viewer_etag" not in g,
+    response_filter=is_ok_response,
+)
 def viewer_regulations_getdetail(id):
     try:
         result = getRegulationContentFromDB(id)
@@ -1378,7 +2096,7 @@ def viewer_regulations_getdetail(id):
             return jsonify({"regulations": result}), 200
         return jsonify({"error": "找不到此通知"}), 404
     except Exception as e:
-        print("error", str(e))
+        logger.exception("%s 失敗", request.path)
         return jsonify({"error": str(e)}), 500
 
 
@@ -0,0 +1,20 @@
+import multiprocessing
+import os
+
+# 啟動方式：gunicorn app:app（會自動讀取此設定檔）
+bind = os.getenv("BIND", "0.0.0.0:8012")
+
+# gevent worker：等待資料庫 / S3 回應時切換到其他請求，一個 worker 可同時處理大量連線
+worker_class = os.getenv("WORKER_CLASS", "gevent")
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_connections = int(os.getenv("WORKER_CONNECTIONS", 1000))
+
+# gunicorn 的 gevent worker 會先 monkey.patch_all()，app.py 看到此變數再替 psycopg2 打補丁
+if worker_class == "gevent":
+    os.environ.setdefault("USE_GEVENT", "1")
+
+# 每個 worker 各有一個連線池，總連線數約為 workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW)，
+# 用環境變數調大連線池時，總數需低於 PostgreSQL 的 max_connections
+
+# 大檔上傳到 S3 需要較長時間
+timeout = int(os.getenv("TIMEOUT", 120))
@@ -0,0 +1,162 @@
+import contextlib
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+
+# 測試用 SQLite 檔案資料庫，需在匯入 app 之前設定
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+os.environ.pop("REDIS_URL", None)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# SQLite 沒有 JSONB，改用 JSON 建表
+@compiles(JSONB, "sqlite")
+def _compile_jsonb(type_, compiler, **kw):
+    return "JSON"
+
+
+import app as app_module  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    flask_app = app_module.app
+    flask_app.config["TESTING"] = True
+    with flask_app.app_context():
+        app_module.db.create_all()
+        app_module.clear_list_cache()
+        yield flask_app
+        app_module.db.session.remove()
+        app_module.db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def user(app):
+    user = app_module.User(
+        username="admin", password=app_module.hash_password("secret")
+    )
+    app_module.db.session.add(user)
+    app_module.db.session.commit()
+    return user
+
+
+@pytest.fixture
+def login(client, user):
+    response = client.post("/login", json={"username": "admin", "password": "secret"})
+    assert response.status_code == 200
+    return client
+
+
+@pytest.fixture
+def shared_cache(app):
+    # 模擬所有 worker 共用的快取後端，測完換回 NullCache
+    app_module.cache.init_app(app, config={"CACHE_TYPE": "SimpleCache"})
+    yield app_module.cache
+    app_module.cache.init_app(app, config={"CACHE_TYPE": "NullCache"})
+
+
+@pytest.fixture
+def count_queries(app):
+    # 以 before_cursor_execute 計算實際送到資料庫的 SQL 數量
+    @contextlib.contextmanager
+    def counter():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = app_module.db.engine
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return counter
+
+
+def make_notification(
+    user,
+    title="第一次常會",
+    session=121,
+    content=(),
+    datestart=datetime(2024, 5, 1, 10),
+):
+    notification = app_module.Notification(
+        title=title,
+        session=session,
+        datestart=datestart,
+        dateend=datestart,
+        is_visible=True,
+        user_id=user.id,
+    )
+    app_module.db.session.add(notification)
+    app_module.db.session.flush()
+    app_module.upsertSchedule(list(content), notification.id, [], is_record=False)
+    app_module.db.session.commit()
+    return notification.id
+
+
+def make_regulation(user, content, revision=()):
+    regulation = app_module.Regulation(
+        title="組織章程", category="憲制性法規篇", is_visible=True, user_id=user.id
+    )
+    app_module.db.session.add(regulation)
+    app_module.db.session.flush()
+    app_module.upsertChapter(content, list(revision), regulation.id)
+    app_module.db.session.commit()
+    return regulation.id
+
+
+def schedules(n):
+    return [
+        {
+            "title": f"議程{i}",
+            "details": [
+                {
+                    "content": f"說明{i}-{j}",
+                    "file_urls": [
+                        {"original": f"附件{i}-{j}.pdf", "safe": f"f{i}-{j}.pdf"}
+                    ],
+                }
+                for j in range(2)
+            ],
+        }
+        for i in range(n)
+    ]
+
+
+def chapters(n):
+    return [
+        {
+            "title": f"第{i}章",
+            "number": i,
+            "articles": [
+                {
+                    "title": f"第{i}-{j}條",
+                    "sort_index": float(j),
+                    "paragraphs": [
+                        {
+                            "number": 1,
+                            "content": "內容",
+                            "clauses": [{"number": 1, "content": "款"}],
+                        }
+                    ],
+                }
+                for j in range(3)
+            ],
+        }
+        for i in range(n)
+    ]
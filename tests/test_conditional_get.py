@@ -0,0 +1,119 @@
+import pytest
+
+import app as app_module
+from conftest import chapters, make_notification, make_regulation
+
+
+def rename(Model, item_id, title):
+    # 直接改資料庫，不經過任何清除快取的流程（相當於另一個 worker 的寫入）
+    app_module.db.session.execute(
+        app_module.update(Model).where(Model.id == item_id).values(title=title)
+    )
+    app_module.db.session.commit()
+
+
+@pytest.mark.parametrize(
+    "url", ["/viewer/notifi/data", "/viewer/regulations/data", "/viewer/notifi/data/1"]
+)
+def test_not_modified_skips_the_view(client, user, count_queries, url):
+    make_notification(user)
+    make_regulation(user, chapters(1))
+
+    first = client.get(url)
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "no-cache"
+    assert "Accept-Encoding" in first.headers["Vary"]
+    etag, _ = first.get_etag()
+
+    with count_queries() as statements:
+        second = client.get(url, headers={"If-None-Match": f'"{etag}"'})
+    assert second.status_code == 304
+    assert second.get_data() == b""
+    assert second.get_etag()[0] == etag
+    assert second.headers["Cache-Control"] == "no-cache"
+    # 只有版本查詢，沒有查詢內容
+    assert len(statements) == 1
+
+
+def test_detail_last_modified(client, user):
+    noti_id = make_notification(user)
+
+    first = client.get(f"/viewer/notifi/data/{noti_id}")
+    assert first.last_modified is not None
+
+    second = client.get(
+        f"/viewer/notifi/data/{noti_id}",
+        headers={"If-Modified-Since": first.headers["Last-Modified"]},
+    )
+    assert second.status_code == 304
+
+
+def test_compressed_etag_matches(client, user):
+    # 內容超過 COMPRESS_MIN_SIZE 才會壓縮，ETag 會帶上 ":br" 後綴
+    for i in range(30):
+        make_notification(user, title=f"第{i}次常會")
+
+    first = client.get("/viewer/notifi/data", headers={"Accept-Encoding": "br"})
+    assert first.headers["Content-Encoding"] == "br"
+    etag, _ = first.get_etag()
+    assert etag.endswith(":br")
+
+    second = client.get(
+        "/viewer/notifi/data",
+        headers={"Accept-Encoding": "br", "If-None-Match": f'"{etag}"'},
+    )
+    assert second.status_code == 304
+
+
+@pytest.mark.parametrize("change", ["edit", "hide", "delete"])
+def test_list_etag_changes_on_write(client, user, change):
+    noti_id = make_notification(user)
+    make_notification(user, title="第二次常會")
+    etag, _ = client.get("/viewer/notifi/data").get_etag()
+
+    if change == "edit":
+        rename(app_module.Notification, noti_id, "修改後")
+    else:
+        stmt = (
+            app_module.update(app_module.Notification).values(is_visible=False)
+            if change == "hide"
+            else app_module.delete(app_module.Notification)
+        )
+        app_module.db.session.execute(stmt.where(app_module.Notification.id == noti_id))
+        app_module.db.session.commit()
+
+    response = client.get("/viewer/notifi/data", headers={"If-None-Match": f'"{etag}"'})
+    assert response.status_code == 200
+    assert response.get_etag()[0] != etag
+
+
+def test_missing_detail_has_no_etag(client, user):
+    response = client.get("/viewer/notifi/data/999")
+    assert response.status_code == 404
+    assert response.get_etag() == (None, None)
+
+
+def test_shared_cache_never_serves_old_content(
+    client, user, shared_cache, count_queries
+):
+    noti_id = make_notification(user)
+    reg_id = make_regulation(user, chapters(1))
+
+    for url, Model, item_id, key in (
+        ("/viewer/notifi/data", app_module.Notification, noti_id, "notifications"),
+        (
+            f"/viewer/notifi/data/{noti_id}",
+            app_module.Notification,
+            noti_id,
+            "notifications",
+        ),
+        ("/viewer/regulations/data", app_module.Regulation, reg_id, "regulations"),
+    ):
+        assert client.get(url).status_code == 200
+        # 第二次只剩版本查詢，內容來自快取
+        with count_queries() as statements:
+            assert client.get(url).status_code == 200
+        assert len(statements) == 1
+
+        rename(Model, item_id, f"改名 {url}")
+        assert client.get(url).json[key][0]["title"] == f"改名 {url}"
@@ -0,0 +1,61 @@
+import pytest
+
+import app as app_module
+from conftest import chapters, make_notification, make_regulation, schedules
+
+
+def count(Model):
+    return app_module.db.session.scalar(
+        app_module.select(app_module.func.count()).select_from(Model)
+    )
+
+
+@pytest.mark.parametrize(
+    "url", ["/notifi/delete", "/minutes/delete", "/regulations/delete"]
+)
+def test_delete_missing_returns_404(login, url):
+    response = login.post(url, data={"id": "999"})
+    assert response.status_code == 404
+    assert "error" in response.json
+
+
+@pytest.mark.parametrize(
+    "url", ["/notifi/delete", "/minutes/delete", "/regulations/delete"]
+)
+def test_delete_without_id_returns_400(login, url):
+    response = login.post(url, data={})
+    assert response.status_code == 400
+
+
+def test_delete_notification_removes_schedules(login, user):
+    noti_id = make_notification(user, content=schedules(2))
+    other_id = make_notification(user, content=schedules(1))
+
+    response = login.post("/notifi/delete", data={"id": str(noti_id)})
+    assert response.status_code == 200
+    assert response.json == {"deleted": noti_id}
+
+    assert app_module.db.session.scalars(
+        app_module.select(app_module.Notification.id)
+    ).all() == [other_id]
+    # 只剩另一筆通知的議程與細項
+    assert count(app_module.Schedule) == 1
+    assert count(app_module.Detail) == 2
+
+
+def test_delete_regulation_removes_tree(login, user):
+    reg_id = make_regulation(user, chapters(2), [{"date": "2024-01-01", "note": "a"}])
+
+    response = login.post("/regulations/delete", data={"id": str(reg_id)})
+    assert response.status_code == 200
+    assert response.json == {"deleted": reg_id}
+
+    for Model in (
+        app_module.Regulation,
+        app_module.Chapter,
+        app_module.Article,
+        app_module.Paragraph,
+        app_module.Clause,
+        app_module.Revision,
+    ):
+        assert count(Model) == 0
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+import app as app_module
+from conftest import make_notification
+
+
+def walk(client, url, limit):
+    # 依 next_cursor 一路翻頁，回傳每頁的 id
+    pages, params = [], {"limit": limit}
+    while True:
+        response = client.get(url, query_string=params)
+        assert response.status_code == 200
+        pages.append([row["id"] for row in response.json["notifications"]])
+        cursor = response.json["next_cursor"]
+        if cursor is None:
+            return pages
+        params = {**cursor, "limit": limit}
+
+
+def test_cursor_round_trip(client, user):
+    start = datetime(2024, 1, 1)
+    ids = [
+        make_notification(user, title=f"第{i}次", datestart=start + timedelta(days=i))
+        for i in range(7)
+    ]
+
+    pages = walk(client, "/viewer/notifi/data", limit=3)
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    # 由新到舊，每筆恰好出現一次
+    assert sum(pages, []) == ids[::-1]
+
+
+def test_cursor_breaks_ties_on_datestart(client, user):
+    same_day = datetime(2024, 5, 1, 10)
+    ids = [make_notification(user, datestart=same_day) for _ in range(5)]
+
+    pages = walk(client, "/viewer/notifi/data", limit=2)
+
+    assert sum(pages, []) == sorted(ids, reverse=True)
+
+
+def test_first_page_includes_session_list(client, user):
+    make_notification(user, session=120)
+    make_notification(user, session=121)
+
+    response = client.get("/viewer/notifi/data", query_string={"limit": 1})
+    assert response.json["session_list"] == [121, 120]
+    assert response.json["next_cursor"] is not None
+
+
+def test_later_pages_reuse_cached_session_list(
+    client, user, shared_cache, count_queries
+):
+    start = datetime(2024, 1, 1)
+    ids = [
+        make_notification(user, session=110 + i, datestart=start + timedelta(days=i))
+        for i in range(4)
+    ]
+    first = client.get("/viewer/notifi/data", query_string={"limit": 2})
+    cursor = first.json["next_cursor"]
+
+    # 第二頁只有版本查詢與本頁查詢，屆次清單來自快取
+    with count_queries() as statements:
+        second = client.get("/viewer/notifi/data", query_string={**cursor, "limit": 2})
+    assert len(statements) == 2
+    assert second.json["session_list"] == [113, 112, 111, 110]
+
+    # 資料異動後版本改變，屆次清單重新查詢
+    app_module.db.session.execute(
+        app_module.update(app_module.Notification)
+        .where(app_module.Notification.id == ids[0])
+        .values(is_visible=False)
+    )
+    app_module.db.session.commit()
+    third = client.get("/viewer/notifi/data", query_string={**cursor, "limit": 2})
+    assert third.json["session_list"] == [113, 112, 111]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"before": "not-a-date"},
+        {"limit": "0"},
+        {"limit": "-5"},
+        {"limit": "abc"},
+    ],
+)
+@pytest.mark.parametrize("url", ["/viewer/notifi/data", "/viewer/minutes/data"])
+def test_bad_page_args_return_400(client, user, url, params):
+    response = client.get(url, query_string=params)
+    assert response.status_code == 400
+    assert "error" in response.json
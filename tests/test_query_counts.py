@@ -0,0 +1,64 @@
+import pytest
+
+from conftest import chapters, make_notification, make_regulation, schedules
+
+
+@pytest.mark.parametrize("url", ["/notifi/data", "/viewer/notifi/data"])
+def test_meeting_list_query_count(client, user, count_queries, url):
+    for i in range(20):
+        make_notification(user, title=f"第{i}次常會", session=110 + i % 5)
+
+    with count_queries() as statements:
+        response = client.get(url)
+    assert response.status_code == 200
+    assert len(response.json["notifications"]) == 20
+    assert len(statements) <= 3
+
+
+@pytest.mark.parametrize("prefix", ["/notifi/data", "/viewer/notifi/data"])
+def test_meeting_detail_query_count(client, user, count_queries, prefix):
+    noti_id = make_notification(user, content=schedules(5))
+
+    with count_queries() as statements:
+        response = client.get(f"{prefix}/{noti_id}")
+    assert response.status_code == 200
+    detail = response.json["notifications"][0]
+    assert len(detail["schedules"]) == 5
+    assert len(detail["schedules"][0]["details"][0]["file_urls"]) == 1
+    assert len(statements) <= 3
+
+
+def test_regulation_list_query_count(client, user, count_queries):
+    make_regulation(user, chapters(1))
+    make_regulation(user, chapters(1))
+
+    with count_queries() as statements:
+        response = client.get("/viewer/regulations/data")
+    assert response.status_code == 200
+    assert len(response.json["regulations"]) == 2
+    assert len(statements) <= 3
+
+
+def test_regulation_detail_query_count_is_constant(app, client, user, count_queries):
+    # 開發模式下 raiseload 會讓漏掉的 lazy load 直接失敗
+    app.debug = True
+    try:
+        small = make_regulation(
+            user, chapters(1), [{"date": "2024-01-01", "note": "a"}]
+        )
+        large = make_regulation(
+            user, chapters(4), [{"date": "2024-01-01", "note": "a"}]
+        )
+
+        counts = []
+        for reg_id in (small, large):
+            with count_queries() as statements:
+                response = client.get(f"/regulations/data/{reg_id}")
+            assert response.status_code == 200
+            counts.append(len(statements))
+    finally:
+        app.debug = False
+
+    # 規章、章、條、項、款、修訂紀錄 各一個查詢，與資料量無關
+    assert counts[0] == counts[1]
+    assert counts[1] <= 6
@@ -0,0 +1,164 @@
+import concurrent.futures
+import io
+import json
+
+import pytest
+from werkzeug.datastructures import FileStorage
+
+import app as app_module
+from conftest import make_notification
+
+
+def meeting_form(**overrides):
+    form = {
+        "id": "-1",
+        "title": "第一次常會",
+        "session": "121",
+        "datestart": "2024-05-01T10:00",
+        "dateend": "2024-05-01T12:00",
+        "is_visible": "true",
+        "present": "[]",
+        "attendance": "[]",
+        "uploadType": "link",
+        "videoLink": "https://example.com/v",
+        "content": json.dumps(
+            [
+                {
+                    "title": "報告事項",
+                    "details": [{"content": "說明", "fileName": ["議程.pdf"]}],
+                }
+            ]
+        ),
+    }
+    form.update(overrides)
+    return form
+
+
+def test_upload_with_new_attachment(app, login, monkeypatch):
+    engine = app_module.db.engine
+    checked_out = []
+
+    def fake_upload(kind, key, file, safe):
+        # 上傳 S3 期間不應佔用資料庫連線
+        checked_out.append(engine.pool.checkedout())
+        return kind, key, file.filename, safe
+
+    monkeypatch.setattr(app_module, "_upload_one", fake_upload)
+
+    for url in ("/notifi/upload", "/minutes/upload"):
+        form = meeting_form()
+        form["newfile-0"] = (io.BytesIO(b"%PDF-1.4"), "議程.pdf")
+        response = login.post(url, data=form, content_type="multipart/form-data")
+        assert response.status_code == 200, response.get_data(as_text=True)
+
+    assert checked_out == [0, 0]
+    safes = app_module.db.session.scalars(
+        app_module.select(app_module.File.filename_with_timestamp)
+    ).all()
+    assert len(safes) == 2
+    assert all(safe.endswith(".pdf") for safe in safes)
+
+    noti_id = app_module.db.session.scalar(
+        app_module.select(app_module.Notification.id)
+    )
+    detail = login.get(f"/notifi/data/{noti_id}").json["notifications"][0]
+    assert detail["schedules"][0]["details"][0]["file_name"] == ["議程.pdf"]
+
+
+@pytest.mark.parametrize(
+    "url, Model", [("/notifi/upload", "Notification"), ("/minutes/upload", "Record")]
+)
+def test_update_missing_meeting_returns_404(login, url, Model):
+    response = login.post(
+        url, data=meeting_form(id="999"), content_type="multipart/form-data"
+    )
+    assert response.status_code == 404
+    assert "error" in response.json
+    table = getattr(app_module, Model)
+    assert app_module.db.session.scalar(app_module.select(table.id)) is None
+
+
+def test_update_missing_regulation_returns_404(login):
+    form = {
+        "id": "999",
+        "title": "組織章程",
+        "category": "憲制性法規篇",
+        "is_visible": "true",
+        "content": "[]",
+        "revision": "[]",
+    }
+    response = login.post(
+        "/regulations/upload", data=form, content_type="multipart/form-data"
+    )
+    assert response.status_code == 404
+    assert "error" in response.json
+
+
+def test_update_existing_notification(login, user):
+    noti_id = make_notification(user)
+    other_id = make_notification(user, title="第二次常會")
+
+    response = login.post(
+        "/notifi/upload",
+        data=meeting_form(id=str(noti_id), title="修改後"),
+        content_type="multipart/form-data",
+    )
+    assert response.status_code == 200
+    assert response.json == {"id": noti_id}
+    titles = dict(
+        app_module.db.session.execute(
+            app_module.select(app_module.Notification.id, app_module.Notification.title)
+        ).all()
+    )
+    assert titles == {noti_id: "修改後", other_id: "第二次常會"}
+
+
+class FakeS3:
+    def __init__(self):
+        self.calls = []
+
+    def upload_fileobj(self, file, bucket, key, ExtraArgs, Config):
+        self.calls.append((key, Config))
+
+
+class FakeCRTManager:
+    def __init__(self):
+        self.calls = []
+
+    def upload(self, fileobj, bucket, key, extra_args):
+        self.calls.append((key, extra_args))
+        future = concurrent.futures.Future()
+        future.set_result(None)
+        return future
+
+
+def attachment(size):
+    return FileStorage(io.BytesIO(b"x" * size), filename="附件.pdf")
+
+
+def test_boto3_upload_picks_config_by_size(monkeypatch):
+    fake_s3 = FakeS3()
+    monkeypatch.setattr(app_module, "s3", fake_s3)
+    monkeypatch.setattr(app_module, "crt_manager", None)
+    monkeypatch.setattr(app_module, "MULTIPART_THRESHOLD", 8)
+
+    app_module._upload_one("newfile", "newfile-0", attachment(4), "small.pdf")
+    app_module._upload_one("newfile", "newfile-1", attachment(16), "big.pdf")
+
+    assert fake_s3.calls == [
+        ("small.pdf", app_module.SMALL_CFG),
+        ("big.pdf", app_module.BIG_CFG),
+    ]
+
+
+def test_crt_upload_when_enabled(monkeypatch):
+    fake_s3 = FakeS3()
+    manager = FakeCRTManager()
+    monkeypatch.setattr(app_module, "s3", fake_s3)
+    monkeypatch.setattr(app_module, "crt_manager", manager)
+
+    result = app_module._upload_one("video", "videoFile", attachment(4), "v.mp4")
+
+    assert result == ("video", "videoFile", "附件.pdf", "v.mp4")
+    assert manager.calls == [("v.mp4", {"ACL": "public-read"})]
+    assert fake_s3.calls == []